@@ -1,5 +1,6 @@
 use serde::Serialize;
 use serde_json;
+use std::borrow::Cow;
 use std::collections::HashMap;
 use std::fs;
 use std::path::PathBuf;
@@ -11,7 +12,7 @@ use crate::models::{
 };
 use crate::modules;
 use once_cell::sync::Lazy;
-use std::sync::Mutex;
+use std::sync::{Mutex, OnceLock};
 
 #[cfg(test)]
 mod tests {
@@ -130,6 +131,77 @@ mod tests {
         println!("NUL prefix case: successfully loaded index after sanitization");
     }
 
+    #[test]
+    fn test_load_accounts_at_paths_preserves_order() {
+        let _guard = TEST_MUTEX.lock().unwrap();
+        let dir = TestDataDir::new();
+        let accounts_dir = dir.path().join("accounts");
+
+        // One file missing in the middle; force 4 workers so the chunked path runs on any CPU count
+        let missing_index = 11;
+        let ids: Vec<String> = (0..24).map(|i| format!("order-test-{:02}", i)).collect();
+        for (i, id) in ids.iter().enumerate() {
+            if i != missing_index {
+                create_account_file(dir.path(), id, &format!("{}@test.com", id));
+            }
+        }
+
+        let paths: Vec<PathBuf> = ids
+            .iter()
+            .map(|id| accounts_dir.join(format!("{}.json", id)))
+            .collect();
+        let results = load_accounts_at_paths_with(&paths, 4);
+
+        assert_eq!(results.len(), ids.len(), "Should return one result per path");
+        for (i, (id, result)) in ids.iter().zip(&results).enumerate() {
+            if i == missing_index {
+                assert!(result.is_err(), "Missing file should yield Err at its own index");
+            } else {
+                let account = result.as_ref().expect("Existing file should load");
+                assert_eq!(&account.id, id, "Results should keep input order");
+            }
+        }
+    }
+
+    #[test]
+    fn test_ensure_data_dir_recreates_removed_dir() {
+        let _guard = TEST_MUTEX.lock().unwrap();
+        let dir = TestDataDir::new();
+        let data_dir = dir.path().join("data");
+
+        ensure_data_dir(&data_dir, true).expect("Should create data dir");
+        assert!(data_dir.is_dir());
+
+        // Removed at runtime: the next check (run on every get_data_dir call) recreates it
+        fs::remove_dir_all(&data_dir).unwrap();
+        ensure_data_dir(&data_dir, true).expect("Should recreate removed data dir");
+        assert!(data_dir.is_dir());
+    }
+
+    #[test]
+    fn test_write_temp_file_recreates_missing_parent() {
+        let _guard = TEST_MUTEX.lock().unwrap();
+        let dir = TestDataDir::new();
+        let temp_path = dir.path().join("removed").join("file.tmp");
+
+        write_temp_file(&temp_path, b"{}").expect("Write should recreate a missing parent dir");
+        assert_eq!(fs::read(&temp_path).unwrap(), b"{}");
+    }
+
+    #[test]
+    fn test_sanitize_index_content_borrows_clean_input() {
+        let json = br#"{"version":"2.0","accounts":[],"current_account_id":null}"#;
+        let sanitized = sanitize_index_content(json);
+        assert!(matches!(sanitized, Cow::Borrowed(_)), "Clean UTF-8 input should not be copied");
+        assert_eq!(sanitized.as_bytes(), &json[..]);
+
+        let mut prefixed = vec![0xEF, 0xBB, 0xBF, 0x00, 0x00];
+        prefixed.extend_from_slice(json);
+        let sanitized = sanitize_index_content(&prefixed);
+        assert!(matches!(sanitized, Cow::Borrowed(_)), "Stripping a prefix should not copy");
+        assert_eq!(sanitized.as_bytes(), &json[..]);
+    }
+
     #[test]
     fn test_load_account_index_with_garbage_content() {
         let _guard = TEST_MUTEX.lock().unwrap();
@@ -329,28 +401,50 @@ const DATA_DIR: &str = ".antigravity_tools";
 const ACCOUNTS_INDEX: &str = "accounts.json";
 const ACCOUNTS_DIR: &str = "accounts";
 
+/// Resolved data directory path and whether it came from `ABV_DATA_DIR`.
+/// Only the env/home lookup is cached; existence is still checked on every call so a
+/// directory removed while the app runs is recreated for all callers.
+static DATA_DIR_CACHE: OnceLock<(PathBuf, bool)> = OnceLock::new();
+
 /// Get data directory path
 pub fn get_data_dir() -> Result<PathBuf, String> {
+    let (data_dir, is_custom) = match DATA_DIR_CACHE.get() {
+        Some(cached) => cached.clone(),
+        None => {
+            let resolved = resolve_data_dir_path()?;
+            DATA_DIR_CACHE.get_or_init(|| resolved).clone()
+        }
+    };
+
+    ensure_data_dir(&data_dir, is_custom)?;
+    Ok(data_dir)
+}
+
+/// Resolve the data directory path (uncached, does not touch the filesystem)
+fn resolve_data_dir_path() -> Result<(PathBuf, bool), String> {
     // [NEW] Support custom data directory via environment variable
     if let Ok(env_path) = std::env::var("ABV_DATA_DIR") {
         if !env_path.trim().is_empty() {
-            let data_dir = PathBuf::from(env_path);
-            if !data_dir.exists() {
-                fs::create_dir_all(&data_dir).map_err(|e| format!("failed_to_create_custom_data_dir: {}", e))?;
-            }
-            return Ok(data_dir);
+            return Ok((PathBuf::from(env_path), true));
         }
     }
 
     let home = dirs::home_dir().ok_or("failed_to_get_home_dir")?;
-    let data_dir = home.join(DATA_DIR);
+    Ok((home.join(DATA_DIR), false))
+}
 
-    // Ensure directory exists
+/// Ensure the data directory exists, creating it if missing
+fn ensure_data_dir(data_dir: &PathBuf, is_custom: bool) -> Result<(), String> {
     if !data_dir.exists() {
-        fs::create_dir_all(&data_dir).map_err(|e| format!("failed_to_create_data_dir: {}", e))?;
+        fs::create_dir_all(data_dir).map_err(|e| {
+            if is_custom {
+                format!("failed_to_create_custom_data_dir: {}", e)
+            } else {
+                format!("failed_to_create_data_dir: {}", e)
+            }
+        })?;
     }
-
-    Ok(data_dir)
+    Ok(())
 }
 
 /// Get accounts directory path
@@ -437,7 +531,7 @@ fn save_account_index_in_dir(data_dir: &PathBuf, index: &AccountIndex) -> Result
         .map_err(|e| format!("failed_to_serialize_account_index: {}", e))?;
 
     // Write to temporary file
-    if let Err(e) = fs::write(&temp_path, content) {
+    if let Err(e) = write_temp_file(&temp_path, content.as_bytes()) {
         // Clean up temp file on failure
         let _ = fs::remove_file(&temp_path);
         return Err(format!("failed_to_write_temp_index_file: {}", e));
@@ -513,9 +607,65 @@ fn rebuild_index_from_accounts_in_dir(data_dir: &PathBuf) -> Result<AccountIndex
 
 /// Load account from a specific path (internal helper)
 fn load_account_at_path(account_path: &PathBuf) -> Result<Account, String> {
-    let content = fs::read_to_string(account_path)
+    let content = fs::read(account_path)
         .map_err(|e| format!("failed_to_read_account_data: {}", e))?;
-    serde_json::from_str(&content).map_err(|e| format!("failed_to_parse_account_data: {}", e))
+    serde_json::from_slice(&content).map_err(|e| format!("failed_to_parse_account_data: {}", e))
+}
+
+/// Load multiple account files, reading them concurrently when there are enough of them.
+/// Results are returned in the same order as `paths`.
+fn load_accounts_at_paths(paths: &[PathBuf]) -> Vec<Result<Account, String>> {
+    const PARALLEL_LOAD_THRESHOLD: usize = 16;
+    const MAX_LOAD_WORKERS: usize = 8;
+
+    let workers = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(MAX_LOAD_WORKERS);
+
+    if paths.len() < PARALLEL_LOAD_THRESHOLD {
+        return load_accounts_at_paths_with(paths, 1);
+    }
+
+    load_accounts_at_paths_with(paths, workers)
+}
+
+/// Load account files split across `workers` scoped threads (serial when `workers <= 1`).
+/// Results are returned in the same order as `paths`.
+fn load_accounts_at_paths_with(paths: &[PathBuf], workers: usize) -> Vec<Result<Account, String>> {
+    if workers <= 1 || paths.is_empty() {
+        return paths.iter().map(load_account_at_path).collect();
+    }
+
+    let chunk_size = (paths.len() + workers - 1) / workers;
+    std::thread::scope(|scope| {
+        let handles: Vec<_> = paths
+            .chunks(chunk_size)
+            .map(|chunk| {
+                let handle = scope
+                    .spawn(move || chunk.iter().map(load_account_at_path).collect::<Vec<_>>());
+                (chunk, handle)
+            })
+            .collect();
+
+        // A failed worker yields one Err per path in its chunk so results stay aligned with `paths`
+        handles
+            .into_iter()
+            .flat_map(|(chunk, handle)| {
+                handle.join().unwrap_or_else(|_| {
+                    chunk
+                        .iter()
+                        .map(|path| {
+                            Err(format!(
+                                "failed_to_read_account_data: loader thread panicked ({:?})",
+                                path
+                            ))
+                        })
+                        .collect()
+                })
+            })
+            .collect()
+    })
 }
 
 /// Load account index with recovery support
@@ -524,8 +674,9 @@ pub fn load_account_index() -> Result<AccountIndex, String> {
     load_account_index_in_dir(&data_dir)
 }
 
-/// Sanitize index file content by stripping BOM and leading NUL bytes
-fn sanitize_index_content(raw: &[u8]) -> String {
+/// Sanitize index file content by stripping BOM and leading NUL bytes.
+/// Borrows from `raw` when the remaining bytes are valid UTF-8.
+fn sanitize_index_content(raw: &[u8]) -> Cow<'_, str> {
     // Skip UTF-8 BOM if present
     let without_bom = if raw.starts_with(&[0xEF, 0xBB, 0xBF]) {
         &raw[3..]
@@ -534,14 +685,13 @@ fn sanitize_index_content(raw: &[u8]) -> String {
     };
 
     // Skip leading NUL bytes
-    let without_nul = without_bom
+    let start = without_bom
         .iter()
-        .skip_while(|&&b| b == 0x00)
-        .copied()
-        .collect::<Vec<u8>>();
+        .position(|&b| b != 0x00)
+        .unwrap_or(without_bom.len());
 
     // Convert to string (lossy - invalid UTF-8 sequences become replacement chars)
-    String::from_utf8_lossy(&without_nul).into_owned()
+    String::from_utf8_lossy(&without_bom[start..])
 }
 
 /// Best-effort save of recovered index without deadlocking
@@ -597,9 +747,22 @@ pub fn save_account_index(index: &AccountIndex) -> Result<(), String> {
     save_account_index_in_dir(&data_dir, index)
 }
 
+/// Write a temp file, recreating its parent directory once if it was removed at runtime
+pub(crate) fn write_temp_file(path: &PathBuf, content: &[u8]) -> std::io::Result<()> {
+    match fs::write(path, content) {
+        Err(e) if e.kind() == std::io::ErrorKind::NotFound => {
+            if let Some(parent) = path.parent() {
+                fs::create_dir_all(parent)?;
+            }
+            fs::write(path, content)
+        }
+        result => result,
+    }
+}
+
 /// Platform-specific atomic file replacement
 #[cfg(target_os = "windows")]
-fn atomic_replace_file(src: &PathBuf, dst: &PathBuf) -> Result<(), String> {
+pub(crate) fn atomic_replace_file(src: &PathBuf, dst: &PathBuf) -> Result<(), String> {
     use std::os::windows::ffi::OsStrExt;
 
     type Bool = i32;
@@ -640,7 +803,7 @@ fn atomic_replace_file(src: &PathBuf, dst: &PathBuf) -> Result<(), String> {
 
 /// Non-Windows: use standard rename
 #[cfg(not(target_os = "windows"))]
-fn atomic_replace_file(src: &PathBuf, dst: &PathBuf) -> Result<(), String> {
+pub(crate) fn atomic_replace_file(src: &PathBuf, dst: &PathBuf) -> Result<(), String> {
     fs::rename(src, dst).map_err(|e| format!("rename failed: {}", e))
 }
 
@@ -662,7 +825,7 @@ pub fn save_account(account: &Account) -> Result<(), String> {
     let content = serde_json::to_string_pretty(account)
         .map_err(|e| format!("failed_to_serialize_account_data: {}", e))?;
 
-    if let Err(e) = std::fs::write(&temp_path, content) {
+    if let Err(e) = write_temp_file(&temp_path, content.as_bytes()) {
         let _ = std::fs::remove_file(&temp_path);
         return Err(format!("failed_to_write_temp_account_file: {}", e));
     }
@@ -679,10 +842,16 @@ pub fn save_account(account: &Account) -> Result<(), String> {
 pub fn list_accounts() -> Result<Vec<Account>, String> {
     crate::modules::logger::log_info("Listing accounts...");
     let index = load_account_index()?;
-    let mut accounts = Vec::new();
+    let accounts_dir = get_accounts_dir()?;
+    let paths: Vec<PathBuf> = index
+        .accounts
+        .iter()
+        .map(|summary| accounts_dir.join(format!("{}.json", summary.id)))
+        .collect();
+    let mut accounts = Vec::with_capacity(paths.len());
 
-    for summary in &index.accounts {
-        match load_account(&summary.id) {
+    for (summary, result) in index.accounts.iter().zip(load_accounts_at_paths(&paths)) {
+        match result {
             Ok(account) => accounts.push(account),
             Err(e) => {
                 crate::modules::logger::log_error(&format!(
@@ -1562,15 +1731,28 @@ pub fn mark_account_forbidden(account_id: &str, reason: &str) -> Result<(), Stri
 /// Export accounts by IDs (for backup/migration)
 pub fn export_accounts_by_ids(account_ids: &[String]) -> Result<crate::models::AccountExportResponse, String> {
     use crate::models::{AccountExportItem, AccountExportResponse};
-    
-    let accounts = list_accounts()?;
-    
-    let export_items: Vec<AccountExportItem> = accounts
-        .into_iter()
-        .filter(|acc| account_ids.contains(&acc.id))
-        .map(|acc| AccountExportItem {
-            email: acc.email,
-            refresh_token: acc.token.refresh_token,
+    use std::collections::HashSet;
+
+    // Only load the selected accounts, one at a time, keeping just the exported fields
+    let wanted: HashSet<&str> = account_ids.iter().map(String::as_str).collect();
+    let index = load_account_index()?;
+
+    let export_items: Vec<AccountExportItem> = index
+        .accounts
+        .iter()
+        .filter(|summary| wanted.contains(summary.id.as_str()))
+        .filter_map(|summary| match load_account(&summary.id) {
+            Ok(acc) => Some(AccountExportItem {
+                email: acc.email,
+                refresh_token: acc.token.refresh_token,
+            }),
+            Err(e) => {
+                crate::modules::logger::log_error(&format!(
+                    "Failed to load account {}: {}",
+                    summary.id, e
+                ));
+                None
+            }
         })
         .collect();
 
@@ -1941,12 +2123,7 @@ pub async fn refresh_all_quotas_logic() -> Result<RefreshStats, String> {
 /// Check and trigger warmup for models that have recovered to 100%
 /// Called automatically after quota refresh to enable immediate warmup
 pub async fn check_and_trigger_warmup_for_recovered_models() {
-    let accounts = match list_accounts() {
-        Ok(acc) => acc,
-        Err(_) => return,
-    };
-
-    // Load config to check if scheduled warmup is enabled
+    // Load config first: when scheduled warmup is off there is no need to read any account
     let app_config = match crate::modules::config::load_app_config() {
         Ok(cfg) => cfg,
         Err(_) => return,
@@ -1956,6 +2133,11 @@ pub async fn check_and_trigger_warmup_for_recovered_models() {
         return;
     }
 
+    let accounts = match list_accounts() {
+        Ok(acc) => acc,
+        Err(_) => return,
+    };
+
     crate::modules::logger::log_info(&format!(
         "[Warmup] Checking {} accounts for recovered models after quota refresh...",
         accounts.len()
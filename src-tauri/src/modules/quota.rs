@@ -488,9 +488,10 @@ pub async fn warm_up_all_accounts() -> Result<String, String> {
             let total_before = warmup_items.len();
             
             // Filter out models warmed up within 4 hours
+            let now_ts = chrono::Utc::now().timestamp();
             warmup_items.retain(|(_, email, model, _, _, _)| {
                 let history_key = format!("{}:{}:100", email, model);
-                !crate::modules::scheduler::check_cooldown(&history_key, 14400)
+                !crate::modules::scheduler::check_cooldown(&history_key, 14400, now_ts)
             });
             
             if warmup_items.is_empty() {
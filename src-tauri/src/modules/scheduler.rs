@@ -30,7 +30,13 @@ fn load_warmup_history() -> HashMap<String, i64> {
 fn save_warmup_history(history: &HashMap<String, i64>) {
     if let Ok(path) = get_warmup_history_path() {
         if let Ok(content) = serde_json::to_string_pretty(history) {
-            let _ = std::fs::write(&path, content);
+            // Write to a temp file and swap it in, so an interrupted write cannot truncate the history
+            let temp_path = path.with_extension(format!("json.tmp.{}", uuid::Uuid::new_v4()));
+            if account::write_temp_file(&temp_path, content.as_bytes()).is_err()
+                || account::atomic_replace_file(&temp_path, &path).is_err()
+            {
+                let _ = std::fs::remove_file(&temp_path);
+            }
         }
     }
 }
@@ -41,10 +47,10 @@ pub fn record_warmup_history(key: &str, timestamp: i64) {
     save_warmup_history(&history);
 }
 
-pub fn check_cooldown(key: &str, cooldown_seconds: i64) -> bool {
+/// `now` is passed in so callers checking many keys read the clock once
+pub fn check_cooldown(key: &str, cooldown_seconds: i64, now: i64) -> bool {
     let history = WARMUP_HISTORY.lock().unwrap();
     if let Some(&last_ts) = history.get(key) {
-        let now = chrono::Utc::now().timestamp();
         now - last_ts < cooldown_seconds
     } else {
         false
@@ -87,18 +93,32 @@ pub fn start_scheduler(app_handle: Option<tauri::AppHandle>, proxy_state: crate:
             let mut warmup_tasks = Vec::new();
             let mut skipped_cooldown = 0;
 
-            // Scan each model for each account
-            for account in &accounts {
-
-                // Get valid token
-                let Ok((token, pid)) = quota::get_valid_token_for_warmup(account).await else {
-                    continue;
-                };
+            // Fetch tokens and quotas concurrently (batch size 5), keeping account order
+            let mut fetched = Vec::with_capacity(accounts.len());
+            for batch in accounts.chunks(5) {
+                let handles: Vec<_> = batch
+                    .iter()
+                    .cloned()
+                    .map(|account| {
+                        tokio::spawn(async move {
+                            // Get valid token
+                            let (token, pid) = quota::get_valid_token_for_warmup(&account).await.ok()?;
+                            // Get fresh quota
+                            let (fresh_quota, _) = quota::fetch_quota_with_cache(&token, &account.email, Some(&pid), Some(&account.id)).await.ok()?;
+                            Some((account, token, pid, fresh_quota))
+                        })
+                    })
+                    .collect();
+
+                for handle in handles {
+                    if let Ok(Some(item)) = handle.await {
+                        fetched.push(item);
+                    }
+                }
+            }
 
-                // Get fresh quota
-                let Ok((fresh_quota, _)) = quota::fetch_quota_with_cache(&token, &account.email, Some(&pid), Some(&account.id)).await else {
-                    continue;
-                };
+            // Scan each model for each account
+            for (account, token, pid, fresh_quota) in fetched {
 
                 // [FIX] 预热阶段检测到 403 时，使用统一禁用逻辑，确保账号文件和索引同时更新
                 if fresh_quota.is_forbidden {
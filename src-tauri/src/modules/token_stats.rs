@@ -133,7 +133,9 @@ pub fn record_usage(
     output_tokens: u32,
 ) -> Result<(), String> {
     let conn = connect_db()?;
-    let timestamp = chrono::Local::now().timestamp();
+    // Resolve the local time once; the hour bucket is derived from the same instant
+    let now = chrono::Local::now();
+    let timestamp = now.timestamp();
     let total_tokens = input_tokens + output_tokens;
 
     // Insert into raw usage table
@@ -143,7 +145,7 @@ pub fn record_usage(
         params![timestamp, account_email, model, input_tokens, output_tokens, total_tokens],
     ).map_err(|e| e.to_string())?;
 
-    let hour_bucket = chrono::Local::now().format("%Y-%m-%d %H:00").to_string();
+    let hour_bucket = now.format("%Y-%m-%d %H:00").to_string();
     conn.execute(
         "INSERT INTO token_stats_hourly (hour_bucket, account_email, total_input_tokens, total_output_tokens, total_tokens, request_count)
          VALUES (?1, ?2, ?3, ?4, ?5, 1)
@@ -231,7 +231,7 @@ impl TokenManager {
         const RETRY_DELAY_MS: u64 = 5;
 
         for attempt in 0..=MAX_RETRIES {
-            let content = match tokio::fs::read_to_string(account_path).await {
+            let content = match tokio::fs::read(account_path).await {
                 Ok(c) => c,
                 Err(e) => {
                     // If the file is gone, the in-memory token is definitely stale.
@@ -251,7 +251,7 @@ impl TokenManager {
                 }
             };
 
-            let account = match serde_json::from_str::<serde_json::Value>(&content) {
+            let account = match serde_json::from_slice::<serde_json::Value>(&content) {
                 Ok(v) => v,
                 Err(e) => {
                     if attempt < MAX_RETRIES {
@@ -293,10 +293,10 @@ impl TokenManager {
 
     /// 加载单个账号
     async fn load_single_account(&self, path: &PathBuf) -> Result<Option<ProxyToken>, String> {
-        let content = std::fs::read_to_string(path).map_err(|e| format!("读取文件失败: {}", e))?;
+        let content = std::fs::read(path).map_err(|e| format!("读取文件失败: {}", e))?;
 
         let mut account: serde_json::Value =
-            serde_json::from_str(&content).map_err(|e| format!("解析 JSON 失败: {}", e))?;
+            serde_json::from_slice(&content).map_err(|e| format!("解析 JSON 失败: {}", e))?;
 
         // [修复 #1344] 先检查账号是否被手动禁用(非配额保护原因)
         let is_proxy_disabled = account